@@ -58,14 +58,22 @@ st.markdown(
     ":violet-badge[:material/star: Favorite] :orange-badge[⚠️ Needs review] :gray-badge[Deprecated]"
 )
 
-df = pd.read_csv("https://gist.githubusercontent.com/netj/8836201/raw/6f9306ad21398ea43cba4f7d537619d0e07d5ae3/iris.csv")
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_iris():
+    return pd.read_csv("https://gist.githubusercontent.com/netj/8836201/raw/6f9306ad21398ea43cba4f7d537619d0e07d5ae3/iris.csv")
+
+df = _load_iris()
 
 st.scatter_chart(data=df, x="sepal.length", y="sepal.width")
 
 import streamlit as st
 import pandas as pd
 
-df = pd.read_csv("https://gist.githubusercontent.com/wmeints/80c1ba22ceeb7a29a0e5e979f0b0afba/raw/8629fe51f0e7642fc5e05567130807b02a93af5e/auto-mpg.csv")
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_auto_mpg():
+    return pd.read_csv("https://gist.githubusercontent.com/wmeints/80c1ba22ceeb7a29a0e5e979f0b0afba/raw/8629fe51f0e7642fc5e05567130807b02a93af5e/auto-mpg.csv")
+
+df = _load_auto_mpg()
 
 st.write("Relationship between Horsepower and weight of the Car")
 st.markdown("Summary of results")
@@ -87,12 +95,14 @@ col1.metric("Temperature", "70 °F", "1.2 °F")
 col2.metric("Wind", "9 mph", "-8%")
 col3.metric("Humidity", "86%", "4%")
 
+import numpy as np
 import streamlit as st
 from numpy.random import default_rng as rng
 
-changes = list(rng(4).standard_normal(20))
-data = [sum(changes[:i]) for i in range(20)]
-delta = round(data[-1], 2)
+changes = rng(4).standard_normal(20)
+data = np.concatenate(([0.0], np.cumsum(changes[:-1])))
+delta = round(float(data[-1]), 2)
+data = data.tolist()
 
 row = st.container(horizontal=True)
 with row:
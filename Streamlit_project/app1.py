@@ -1,7 +1,7 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import streamlit as st
-import seaborn as sns
 
 # Page config
 st.set_page_config(page_title="Divorce Analysis", page_icon="💔")
@@ -11,12 +11,137 @@ st.title("Divorce Prediction Analysis")
 st.write("Analysing factors that influence divorce")
 
 # Load data
-@st.cache_data
+@st.cache_data(persist="disk", show_spinner="Loading divorce data…")
 def load_data():
-    df = pd.read_csv("https://raw.githubusercontent.com/tishsrisasi/my-first-project/refs/heads/main/divorce_df.csv")
-    return df
+    df = pd.read_csv("https://raw.githubusercontent.com/tishsrisasi/my-first-project/refs/heads/main/divorce_df.csv", engine="pyarrow")
+    df = df.astype({'num_children': 'int8', 'infidelity_occurred': 'int8', 'divorced': 'int8'})
+    for c in df.select_dtypes('float').columns:
+        df[c] = pd.to_numeric(df[c], downcast='float')
+    for c in df.select_dtypes('integer').columns:
+        df[c] = pd.to_numeric(df[c], downcast='integer')
+    return df, df.select_dtypes(include='number').columns.tolist()
+
+df, _ = load_data()
 
-df = load_data()
+@st.cache_data
+def _sidebar_options():
+    df, _ = load_data()
+    return {
+        'age': (int(df['age_at_marriage'].min()), int(df['age_at_marriage'].max())),
+        'duration': (int(df['marriage_duration_years'].min()), int(df['marriage_duration_years'].max())),
+        'children': sorted(df['num_children'].unique().tolist()),
+    }
+
+sidebar_opts = _sidebar_options()
+
+# Cached filter and aggregate helpers; argument-keyed caches are bounded
+@st.cache_data(max_entries=64)
+def apply_filters(age_range, duration_range, children_filter, infidelity_filter):
+    df, _ = load_data()
+    age = df['age_at_marriage'].to_numpy()
+    duration = df['marriage_duration_years'].to_numpy()
+    masks = [
+        age >= age_range[0],
+        age <= age_range[1],
+        duration >= duration_range[0],
+        duration <= duration_range[1],
+        np.isin(df['num_children'].to_numpy(), children_filter),
+    ]
+
+    inf_val = {'No Infidelity': 0, 'Infidelity Occurred': 1}.get(infidelity_filter)
+    if inf_val is not None:
+        masks.append(df['infidelity_occurred'].to_numpy() == inf_val)
+    return df[np.logical_and.reduce(masks)]
+
+GROUP_COLS = ['infidelity_occurred', 'num_children', 'divorced']
+
+def divorce_by_infidelity_rate(sub):
+    return sub.groupby('infidelity_occurred')['divorced'].mean()
+
+def divorce_by_children_rate(sub):
+    return sub.groupby('num_children')['divorced'].mean()
+
+@st.cache_data(max_entries=64)
+def filtered_rates(age_range, duration_range, children_filter, infidelity_filter):
+    filtered_df = apply_filters(age_range, duration_range, children_filter, infidelity_filter)
+    group_df = filtered_df[GROUP_COLS]
+    return divorce_by_infidelity_rate(group_df), divorce_by_children_rate(group_df)
+
+@st.cache_data
+def _full_rates():
+    df, _ = load_data()
+    group_df = df[GROUP_COLS]
+    return divorce_by_infidelity_rate(group_df), divorce_by_children_rate(group_df)
+
+@st.cache_data
+def _corr():
+    df, numerical_cols = load_data()
+    return df[numerical_cols].corr()
+
+@st.cache_data
+def _describe():
+    df, _ = load_data()
+    return df.describe()
+
+@st.cache_data
+def _divorce_counts():
+    df, _ = load_data()
+    return df["divorced"].value_counts()
+
+# Figure builders; only their inputs are cached, figures are drawn fresh per run
+def divorce_pie_fig(divorce_counts):
+    fig, ax = plt.subplots()
+    colors = ["#2ecc71", "#e74c3c"]
+    ax.pie(
+        divorce_counts,
+        labels=["Not Divorced", "Divorced"],
+        autopct="%1.1f%%",
+        colors=colors,
+    )
+    return fig
+
+def age_hist_fig(ages):
+    fig, ax = plt.subplots()
+    counts, edges = np.histogram(ages.to_numpy(), bins=30)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge",
+           color="skyblue", edgecolor="black")
+    ax.set_xlabel("Age")
+    ax.set_ylabel("Count")
+    return fig
+
+def corr_heatmap_fig(correlation_matrix):
+    cols = correlation_matrix.columns
+    fig, ax = plt.subplots(figsize=(10, 8))
+    im = ax.imshow(correlation_matrix.values, cmap='coolwarm', vmin=-1, vmax=1, aspect='auto')
+    ax.set_xticks(range(len(cols)))
+    ax.set_xticklabels(cols, rotation=90)
+    ax.set_yticks(range(len(cols)))
+    ax.set_yticklabels(cols)
+    fig.colorbar(im, ax=ax)
+    ax.set_title('Feature Correlation Matrix')
+    return fig
+
+def top_corr_fig(correlation_matrix):
+    s = correlation_matrix['divorced'].drop('divorced')
+    correlations = s.reindex(s.abs().nlargest(10).index)
+    fig, ax = plt.subplots()
+    colors = np.where(correlations.values > 0, 'red', 'green')
+    ax.barh(correlations.index, correlations.values, color=colors)
+    ax.set_xlabel('Correlation with Divorce')
+    return fig
+
+def build_static_charts(divorce_by_infidelity, divorce_by_children):
+    fig3, ax3 = plt.subplots()
+    ax3.bar(['No Infidelity', 'Infidelity'], divorce_by_infidelity.values,
+            color=['green', 'red'])
+    ax3.set_ylabel('Divorce Rate')
+    ax3.set_ylim(0, 1)
+
+    fig4, ax4 = plt.subplots()
+    ax4.bar(divorce_by_children.index, divorce_by_children.values, color='coral')
+    ax4.set_xlabel('Number of Children')
+    ax4.set_ylabel('Divorce Rate')
+    return {'infidelity': fig3, 'children': fig4}
 
 # Basic info
 st.header("Dataset Overview")
@@ -35,31 +160,18 @@ st.dataframe(df.head())
 
 # Basic statistics
 st.subheader("Basic Statistics")
-st.write(df.describe())
+st.write(_describe())
 
 # Simple visualizations
 st.header("Visualizations")
 
 # 1. Divorce distribution
 st.subheader("Divorce Distribution")
-fig1, ax1 = plt.subplots()
-divorce_counts = df["divorced"].value_counts()
-colors = ["#2ecc71", "#e74c3c"]
-ax1.pie(
-    divorce_counts,
-    labels=["Not Divorced", "Divorced"],
-    autopct="%1.1f%%",
-    colors=colors,
-)
-st.pyplot(fig1)
+st.pyplot(divorce_pie_fig(_divorce_counts()))
 
 # 2. Age at marriage distribution
 st.subheader("Age at Marriage Distribution")
-fig2, ax2 = plt.subplots()
-ax2.hist(df["age_at_marriage"], bins=30, color="skyblue", edgecolor="black")
-ax2.set_xlabel("Age")
-ax2.set_ylabel("Count")
-st.pyplot(fig2)
+st.pyplot(age_hist_fig(df["age_at_marriage"]))
 
 # Footer
 st.markdown("---")
@@ -68,46 +180,33 @@ st.markdown("**App 1:** Basic data overview and simple charts")
 # NEW: Additional visualizations
 st.header("Detailed Analysis")
 
+# Rebuild these charts only when the underlying rates change (e.g. after a data reload)
+divorce_by_infidelity, divorce_by_children = _full_rates()
+static_key = (tuple(divorce_by_infidelity.items()), tuple(divorce_by_children.items()))
+if st.session_state.get('static_charts_key') != static_key:
+    st.session_state.static_charts = build_static_charts(divorce_by_infidelity, divorce_by_children)
+    st.session_state.static_charts_key = static_key
+static_charts = st.session_state.static_charts
+
 # 3. Divorce by key factors
 col3, col4 = st.columns(2)
 
 with col3:
     st.subheader("Divorce Rate by Infidelity")
-    fig3, ax3 = plt.subplots()
-    divorce_by_infidelity = df.groupby('infidelity_occurred')['divorced'].mean()
-    ax3.bar(['No Infidelity', 'Infidelity'], divorce_by_infidelity.values, 
-            color=['green', 'red'])
-    ax3.set_ylabel('Divorce Rate')
-    ax3.set_ylim(0, 1)
-    st.pyplot(fig3)
+    st.pyplot(static_charts['infidelity'])
 
 with col4:
     st.subheader("Divorce Rate by Children")
-    fig4, ax4 = plt.subplots()
-    divorce_by_children = df.groupby('num_children')['divorced'].mean()
-    ax4.bar(divorce_by_children.index, divorce_by_children.values, color='coral')
-    ax4.set_xlabel('Number of Children')
-    ax4.set_ylabel('Divorce Rate')
-    st.pyplot(fig4)
+    st.pyplot(static_charts['children'])
 
 # Correlation heatmap
 st.header("Correlation Analysis")
-numerical_cols = df.select_dtypes(include='number').columns.tolist()
-correlation_matrix = df[numerical_cols].corr()
-
-fig5, ax5 = plt.subplots(figsize=(10, 8))
-sns.heatmap(correlation_matrix, annot=False, cmap='coolwarm', center=0, ax=ax5)
-ax5.set_title('Feature Correlation Matrix')
-st.pyplot(fig5)
+correlation_matrix = _corr()
+st.pyplot(corr_heatmap_fig(correlation_matrix))
 
 # Top correlations with divorce
 st.subheader("Top Factors Correlated with Divorce")
-correlations = correlation_matrix['divorced'].sort_values(ascending=False)[1:11]
-fig6, ax6 = plt.subplots()
-colors = ['red' if x > 0 else 'green' for x in correlations.values]
-ax6.barh(correlations.index, correlations.values, color=colors)
-ax6.set_xlabel('Correlation with Divorce')
-st.pyplot(fig6)
+st.pyplot(top_corr_fig(correlation_matrix))
 
 # Footer
 st.markdown("---")
@@ -119,24 +218,24 @@ st.sidebar.header("Filters")
 # Age filter
 age_range = st.sidebar.slider(
     "Age at Marriage",
-    min_value=int(df['age_at_marriage'].min()),
-    max_value=int(df['age_at_marriage'].max()),
+    min_value=sidebar_opts['age'][0],
+    max_value=sidebar_opts['age'][1],
     value=(20, 40)
 )
 
 # Duration filter
 duration_range = st.sidebar.slider(
     "Marriage Duration (years)",
-    min_value=int(df['marriage_duration_years'].min()),
-    max_value=int(df['marriage_duration_years'].max()),
+    min_value=sidebar_opts['duration'][0],
+    max_value=sidebar_opts['duration'][1],
     value=(0, 10)
 )
 
 # Children filter
 children_filter = st.sidebar.multiselect(
     "Number of Children",
-    options=sorted(df['num_children'].unique()),
-    default=sorted(df['num_children'].unique())
+    options=sidebar_opts['children'],
+    default=sidebar_opts['children']
 )
 
 # Infidelity filter
@@ -146,18 +245,13 @@ infidelity_filter = st.sidebar.radio(
 )
 
 # Apply filters
-filtered_df = df[
-    (df['age_at_marriage'] >= age_range[0]) & 
-    (df['age_at_marriage'] <= age_range[1]) &
-    (df['marriage_duration_years'] >= duration_range[0]) & 
-    (df['marriage_duration_years'] <= duration_range[1]) &
-    (df['num_children'].isin(children_filter))
-]
-
-if infidelity_filter == 'No Infidelity':
-    filtered_df = filtered_df[filtered_df['infidelity_occurred'] == 0]
-elif infidelity_filter == 'Infidelity Occurred':
-    filtered_df = filtered_df[filtered_df['infidelity_occurred'] == 1]
+filter_args = (
+    age_range,
+    duration_range,
+    tuple(sorted(children_filter)),
+    infidelity_filter,
+)
+filtered_df = apply_filters(*filter_args)
 
 # Basic info with filtered data
 st.header("Dataset Overview")
@@ -202,7 +296,9 @@ with col2:
     # 2. Age at marriage distribution
     st.subheader("Age at Marriage Distribution")
     fig2, ax2 = plt.subplots()
-    ax2.hist(filtered_df['age_at_marriage'], bins=20, color='skyblue', edgecolor='black')
+    counts, edges = np.histogram(filtered_df['age_at_marriage'].to_numpy(), bins=20)
+    ax2.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+            color='skyblue', edgecolor='black')
     ax2.set_xlabel('Age')
     ax2.set_ylabel('Count')
     st.pyplot(fig2)
@@ -210,13 +306,13 @@ with col2:
 # Detailed Analysis
 st.header("Detailed Analysis (Filtered)")
 
+divorce_by_infidelity, divorce_by_children = filtered_rates(*filter_args)
 col3, col4 = st.columns(2)
 
 with col3:
     st.subheader("Divorce Rate by Infidelity")
     fig3, ax3 = plt.subplots()
     if len(filtered_df) > 0:
-        divorce_by_infidelity = filtered_df.groupby('infidelity_occurred')['divorced'].mean()
         if len(divorce_by_infidelity) > 0:
             labels = ['No Infidelity', 'Infidelity'][:len(divorce_by_infidelity)]
             ax3.bar(labels, divorce_by_infidelity.values, color=['green', 'red'][:len(divorce_by_infidelity)])
@@ -227,7 +323,5 @@ with col3:
 with col4:
     st.subheader("Divorce Rate by Children")
     fig4, ax4 = plt.subplots()
-    if len(filtered_df) > 0:
-        divorce_by_children = filtered_df.groupby('num_children')['divorced'].mean()
 
 